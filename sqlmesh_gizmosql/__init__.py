@@ -1,17 +1,17 @@
 """
 SQLMesh GizmoSQL Adapter.
 
-This package provides GizmoSQL support for SQLMesh. When imported, it automatically
-registers the GizmoSQL engine adapter and connection configuration with SQLMesh.
+This package provides GizmoSQL support for SQLMesh by registering the GizmoSQL engine
+adapter and connection configuration with SQLMesh.
+
+``import sqlmesh_gizmosql`` by itself doesn't pull in SQLMesh. Registration happens
+as soon as SQLMesh's connection config module is loaded (or immediately, if it
+already is), or earlier if either class below is accessed.
 
 Usage:
-    # Option 1: Explicit import (recommended for clarity)
-    import sqlmesh_gizmosql
+    import sqlmesh_gizmosql  # Registers GizmoSQL when SQLMesh is loaded
     from sqlmesh import Context
 
-    # Option 2: Just import - registration happens automatically
-    import sqlmesh_gizmosql  # noqa: F401
-
     # Then use SQLMesh normally with type: gizmosql in your config
 
 Example config.yaml:
@@ -26,43 +26,127 @@ Example config.yaml:
           database: my_database
 """
 
-from sqlmesh_gizmosql.adapter import GizmoSQLEngineAdapter
-from sqlmesh_gizmosql.connection import GizmoSQLConnectionConfig
+from __future__ import annotations
+
+import importlib
+import importlib.abc
+import importlib.machinery
+import sys
+import threading
+import typing as t
+
+if t.TYPE_CHECKING:
+    from sqlmesh_gizmosql.adapter import GizmoSQLEngineAdapter
+    from sqlmesh_gizmosql.connection import GizmoSQLConnectionConfig
 
 __version__ = "0.2.3"
 __all__ = ["GizmoSQLEngineAdapter", "GizmoSQLConnectionConfig", "register", "__version__"]
 
+_LAZY_ATTRIBUTES = {
+    "GizmoSQLEngineAdapter": "sqlmesh_gizmosql.adapter",
+    "GizmoSQLConnectionConfig": "sqlmesh_gizmosql.connection",
+}
+_SQLMESH_CONNECTION_MODULE = "sqlmesh.core.config.connection"
+
 _registered = False
+# Reentrant because the adapter and connection modules call register() when they finish
+# importing, which can happen while register() is importing them.
+_register_lock = threading.RLock()
 
 
 def register() -> None:
     """
     Register GizmoSQL adapter and connection config with SQLMesh.
 
-    This function is called automatically when the module is imported,
-    but can also be called explicitly if needed.
+    This function is called automatically when SQLMesh's connection config module is
+    loaded, when either class is first accessed, or when one of the submodules is
+    imported, but can also be called explicitly.
     """
     global _registered
+    # Lock-free fast path once registered; the flag is re-checked under the lock so
+    # threads racing through the first call don't both register.
     if _registered:
         return
+    with _register_lock:
+        if _registered:
+            return
+
+        # Register the engine adapter
+        from sqlmesh.core import engine_adapter
+
+        from sqlmesh_gizmosql.adapter import GizmoSQLEngineAdapter
+
+        if "gizmosql" not in engine_adapter.DIALECT_TO_ENGINE_ADAPTER:
+            engine_adapter.DIALECT_TO_ENGINE_ADAPTER["gizmosql"] = GizmoSQLEngineAdapter
+
+        # Register the connection config
+        from sqlmesh.core.config import connection as conn_module
+
+        from sqlmesh_gizmosql.connection import GizmoSQLConnectionConfig
+
+        if "gizmosql" not in conn_module.CONNECTION_CONFIG_TO_TYPE:
+            conn_module.CONNECTION_CONFIG_TO_TYPE["gizmosql"] = GizmoSQLConnectionConfig
+
+        if "gizmosql" not in conn_module.DIALECT_TO_TYPE:
+            conn_module.DIALECT_TO_TYPE["gizmosql"] = GizmoSQLConnectionConfig.DIALECT
+
+        _registered = True
+        if _finder in sys.meta_path:
+            sys.meta_path.remove(_finder)
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _LAZY_ATTRIBUTES:
+        register()
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _RegisteringLoader(importlib.abc.Loader):
+    """Loader wrapper that registers GizmoSQL once the wrapped module has executed."""
+
+    def __init__(self, loader: importlib.abc.Loader) -> None:
+        self._loader = loader
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._loader, name)
 
-    # Register the engine adapter
-    from sqlmesh.core import engine_adapter
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> t.Any:
+        return self._loader.create_module(spec)
 
-    if "gizmosql" not in engine_adapter.DIALECT_TO_ENGINE_ADAPTER:
-        engine_adapter.DIALECT_TO_ENGINE_ADAPTER["gizmosql"] = GizmoSQLEngineAdapter
+    def exec_module(self, module: t.Any) -> None:
+        self._loader.exec_module(module)
+        # A submodule of ours that is importing SQLMesh isn't finished yet, and registers
+        # itself with the register() call at its end.
+        if not any(name in sys.modules for name in _LAZY_ATTRIBUTES.values()):
+            register()
 
-    # Register the connection config
-    from sqlmesh.core.config import connection as conn_module
 
-    if "gizmosql" not in conn_module.CONNECTION_CONFIG_TO_TYPE:
-        conn_module.CONNECTION_CONFIG_TO_TYPE["gizmosql"] = GizmoSQLConnectionConfig
+class _RegisterOnImportFinder(importlib.abc.MetaPathFinder):
+    """Wraps the loader of SQLMesh's connection config module in a _RegisteringLoader."""
 
-    if "gizmosql" not in conn_module.DIALECT_TO_TYPE:
-        conn_module.DIALECT_TO_TYPE["gizmosql"] = GizmoSQLConnectionConfig.DIALECT
+    def find_spec(
+        self, fullname: str, path: t.Any, target: t.Any = None
+    ) -> t.Optional[importlib.machinery.ModuleSpec]:
+        if fullname != _SQLMESH_CONNECTION_MODULE:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None:
+                    spec.loader = _RegisteringLoader(spec.loader)
+                return spec
+        return None
 
-    _registered = True
 
+_finder = _RegisterOnImportFinder()
 
-# Auto-register on import
-register()
+if _SQLMESH_CONNECTION_MODULE in sys.modules:
+    # SQLMesh is already loaded, so registering costs no extra imports.
+    register()
+else:
+    sys.meta_path.insert(0, _finder)
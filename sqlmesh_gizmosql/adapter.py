@@ -211,10 +211,19 @@ class GizmoSQLEngineAdapter(
             if source_columns
             else target_columns_to_types
         )
-        ordered_df = df[list(source_columns_to_types.keys())]
 
-        # Convert DataFrame to PyArrow Table for bulk ingestion
-        arrow_table = pa.Table.from_pandas(ordered_df)
+        # from_pandas() silently skips requested columns the DataFrame lacks, so fail
+        # here the way selecting them with df[columns] would.
+        missing_columns = [col for col in source_columns_to_types if col not in df.columns]
+        if missing_columns:
+            raise KeyError(f"{missing_columns} not in DataFrame columns")
+
+        # Convert DataFrame to PyArrow Table for bulk ingestion. Selecting the columns
+        # during conversion avoids materializing a reordered copy of the DataFrame, and
+        # the index is never a target column so it isn't sent to the server.
+        arrow_table = pa.Table.from_pandas(
+            df, columns=list(source_columns_to_types), preserve_index=False
+        )
 
         # Use ADBC bulk ingestion with temporary table
         # Note: DuckDB temporary tables cannot have catalog/schema prefixes,
@@ -330,3 +339,10 @@ class GizmoSQLEngineAdapter(
         result = cursor.fetchall()
         columns = [desc[0] for desc in cursor.description] if cursor.description else []
         return pd.DataFrame(result, columns=columns)
+
+
+# Importing either submodule directly (rather than through the package's lazy
+# attributes) must still register GizmoSQL with SQLMesh.
+from sqlmesh_gizmosql import register  # noqa: E402
+
+register()
@@ -6,26 +6,45 @@ Provides the connection configuration class for GizmoSQL servers.
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import importlib.util
+import sys
+import threading
 import typing as t
 
 from pydantic import Field
+from sqlglot import exp
 from sqlmesh.core.config.common import concurrent_tasks_validator
 from sqlmesh.core.config.connection import ConnectionConfig
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.pydantic import model_validator
 
-from sqlmesh_gizmosql.adapter import GizmoSQLEngineAdapter
+# Whether adbc_driver_gizmosql can be imported, resolved on the first config validation.
+_adbc_driver_present: t.Optional[bool] = None
 
 
 def _gizmosql_import_validator(cls: t.Any, data: t.Any) -> t.Any:
-    """Validate that ADBC GizmoSQL driver is installed."""
+    """
+    Validate that ADBC GizmoSQL driver is installed.
+
+    The driver is only located, not imported, so its native library isn't loaded until
+    the first connection is made.
+    """
+    global _adbc_driver_present
+
     check_import = data.pop("check_import", True) if isinstance(data, dict) else True
     if not check_import:
         return data
-    try:
-        import adbc_driver_gizmosql  # noqa: F401
-    except ImportError:
+    if _adbc_driver_present is None:
+        # find_spec() raises ValueError for an already-imported module without a
+        # __spec__, so a module that's already loaded is taken as present.
+        _adbc_driver_present = (
+            sys.modules.get("adbc_driver_gizmosql") is not None
+            or importlib.util.find_spec("adbc_driver_gizmosql") is not None
+        )
+    if not _adbc_driver_present:
         raise ConfigError(
             "Failed to import the 'adbc_driver_gizmosql' library. "
             "Please install it with: pip install sqlmesh-gizmosql "
@@ -34,6 +53,185 @@ def _gizmosql_import_validator(cls: t.Any, data: t.Any) -> t.Any:
     return data
 
 
+# Vendor versions of the servers already verified to run the DuckDB backend, keyed by
+# (host, port). A server's backend cannot change underneath a running process, so the
+# adbc_get_info() round-trip is only paid on the first connection to each server.
+_VERIFIED_VENDORS: t.Dict[t.Tuple[str, int], str] = {}
+
+
+def _verify_duckdb_backend(conn: t.Any, server: t.Tuple[str, int]) -> None:
+    """Verify the backend is DuckDB - this adapter only supports the DuckDB backend."""
+    if server in _VERIFIED_VENDORS:
+        return
+
+    vendor_version = conn.adbc_get_info().get("vendor_version", "")
+    if not vendor_version.startswith("duckdb "):
+        conn.close()
+        raise ConfigError(
+            f"Unsupported GizmoSQL server backend: '{vendor_version}'. "
+            "This adapter only supports the DuckDB backend for GizmoSQL."
+        )
+    _VERIFIED_VENDORS[server] = vendor_version
+
+
+class _PooledConnection:
+    """
+    Proxy around a raw ADBC connection that hands it back to its pool on close().
+
+    Everything other than close() is delegated to the wrapped connection, so SQLMesh
+    can use it exactly like the connection returned by ``dbapi.connect()``.
+    """
+
+    def __init__(self, conn: t.Any, pool: _ConnectionPool, catalog: t.Optional[str]) -> None:
+        self._conn = conn
+        self._pool = pool
+        self._catalog = catalog
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._conn, name)
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool.release(conn, self._catalog)
+
+
+class _ConnectionPool:
+    """
+    A LIFO of idle Flight SQL connections to a single GizmoSQL server.
+
+    Opening a connection costs a gRPC (and usually TLS) handshake plus ADBC driver
+    initialization, so connections closed by SQLMesh are kept warm and handed out
+    again instead of being torn down. At most ``size`` idle connections are kept.
+
+    A released connection has any open transaction rolled back and its catalog reset
+    to the one it started in before it is kept; if that fails it is closed instead.
+    """
+
+    def __init__(self, creator: t.Callable[[], t.Any], size: int, pre_ping: bool) -> None:
+        self._creator = creator
+        self._size = size
+        self._pre_ping = pre_ping
+        # Idle connections paired with the catalog each one started in
+        self._idle: t.List[t.Tuple[t.Any, t.Optional[str]]] = []
+        self._lock = threading.Lock()
+
+    def connect(self) -> _PooledConnection:
+        while True:
+            with self._lock:
+                idle = self._idle.pop() if self._idle else None
+            if idle is None:
+                conn = self._creator()
+                try:
+                    catalog = _current_catalog(conn)
+                except Exception:
+                    _close_quietly(conn)
+                    raise
+                return _PooledConnection(conn, self, catalog)
+            conn, catalog = idle
+            if not self._pre_ping or _is_alive(conn):
+                return _PooledConnection(conn, self, catalog)
+            _close_quietly(conn)
+
+    def release(self, conn: t.Any, catalog: t.Optional[str]) -> None:
+        with self._lock:
+            full = len(self._idle) >= self._size
+        if not full and _reset(conn, catalog):
+            with self._lock:
+                if len(self._idle) < self._size:
+                    self._idle.append((conn, catalog))
+                    return
+        _close_quietly(conn)
+
+    def dispose(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            _close_quietly(conn)
+
+
+def _current_catalog(conn: t.Any) -> t.Optional[str]:
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT current_database()")
+        row = cursor.fetchone()
+    finally:
+        cursor.close()
+    return row[0] if row else None
+
+
+def _reset(conn: t.Any, catalog: t.Optional[str]) -> bool:
+    """Return a connection to a clean state so nothing leaks to its next user."""
+    try:
+        cursor = conn.cursor()
+        try:
+            # DuckDB refuses to roll back when no transaction is open, which is the usual
+            # case, and the wording of that error isn't something to depend on. A
+            # connection that is actually broken fails the USE below as well.
+            with contextlib.suppress(Exception):
+                cursor.execute("ROLLBACK")
+            if catalog is not None:
+                cursor.execute(exp.Use(this=exp.to_identifier(catalog)).sql(dialect="duckdb"))
+        finally:
+            cursor.close()
+    except Exception:
+        return False
+    return True
+
+
+def _is_alive(conn: t.Any) -> bool:
+    """Check that an idle connection can still run a trivial query."""
+    try:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+        finally:
+            cursor.close()
+    except Exception:
+        return False
+    return True
+
+
+def _close_quietly(conn: t.Any) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass  # The connection is being discarded anyway
+
+
+# Pools are shared by every config pointing at the same server with the same
+# credentials and pool options, keyed by ``GizmoSQLConnectionConfig._pool_key``.
+_POOLS: t.Dict[t.Tuple[t.Tuple[str, t.Any], ...], _ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(
+    key: t.Tuple[t.Tuple[str, t.Any], ...],
+    creator: t.Callable[[], t.Any],
+    size: int,
+    pre_ping: bool,
+) -> _ConnectionPool:
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = _ConnectionPool(creator, size=size, pre_ping=pre_ping)
+        return pool
+
+
+def _dispose_pools() -> None:
+    """Close every idle pooled connection."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    for pool in pools:
+        pool.dispose()
+
+
+# SQLMesh has no hook for closing a connection config, so idle connections are closed
+# at interpreter exit instead of being left for the ADBC driver to warn about.
+atexit.register(_dispose_pools)
+
+
 class GizmoSQLConnectionConfig(ConnectionConfig):
     """
     GizmoSQL connection configuration.
@@ -51,10 +249,15 @@ class GizmoSQLConnectionConfig(ConnectionConfig):
         disable_certificate_verification: Whether to skip TLS certificate verification.
             Useful for self-signed certificates in development (default: False).
         auth_type: Authentication type (e.g., "external" for browser-based OAuth/SSO).
+        skip_vendor_check: Whether to skip verifying that the server runs the DuckDB
+            backend. The check is only done on the first connection to each server
+            (default: False).
         database: The default database/catalog to use.
-        concurrent_tasks: The maximum number of concurrent tasks.
+        concurrent_tasks: The maximum number of concurrent tasks. This also caps the
+            number of idle connections kept warm in the connection pool.
         register_comments: Whether to register model comments.
-        pre_ping: Whether to pre-ping the connection.
+        pre_ping: Whether to pre-ping the connection. Idle pooled connections are
+            also validated before being reused.
     """
 
     host: str = "localhost"
@@ -64,6 +267,7 @@ class GizmoSQLConnectionConfig(ConnectionConfig):
     use_encryption: bool = True
     disable_certificate_verification: bool = False
     auth_type: t.Optional[str] = None
+    skip_vendor_check: bool = False
     database: t.Optional[str] = None
 
     concurrent_tasks: int = 4
@@ -85,47 +289,73 @@ class GizmoSQLConnectionConfig(ConnectionConfig):
 
     @property
     def _engine_adapter(self) -> t.Type[EngineAdapter]:
+        # Imported here so the adapter module can register with SQLMesh (which imports
+        # this module) before this module has finished importing.
+        from sqlmesh_gizmosql.adapter import GizmoSQLEngineAdapter
+
         return GizmoSQLEngineAdapter
 
+    @property
+    def _flight_sql_connect_kwargs(self) -> t.Dict[str, t.Any]:
+        """The keyword arguments passed to ``dbapi.connect()``."""
+        # Build the URI for the Flight SQL connection
+        protocol = "grpc+tls" if self.use_encryption else "grpc"
+        uri = f"{protocol}://{self.host}:{self.port}"
+
+        connect_kwargs: t.Dict[str, t.Any] = {"uri": uri}
+        if self.auth_type:
+            connect_kwargs["auth_type"] = self.auth_type
+        if self.username:
+            connect_kwargs["username"] = self.username
+            connect_kwargs["password"] = self.password or ""
+        if self.use_encryption and self.disable_certificate_verification:
+            connect_kwargs["tls_skip_verify"] = True
+        return connect_kwargs
+
+    @property
+    def _pool_key(self) -> t.Tuple[t.Tuple[str, t.Any], ...]:
+        # The pool keeps the first config's creator, size and pre-ping setting, so every
+        # option that shapes them is part of the key, not just the connect arguments.
+        return tuple(sorted(self._flight_sql_connect_kwargs.items())) + (
+            ("skip_vendor_check", self.skip_vendor_check),
+            ("concurrent_tasks", self.concurrent_tasks),
+            ("pre_ping", self.pre_ping),
+        )
+
     @property
     def _connection_factory(self) -> t.Callable:
         """
         Create a connection factory for GizmoSQL using adbc-driver-gizmosql.
 
         The connection is established using the Arrow Flight SQL protocol over gRPC.
+        Connections are drawn from a pool shared by all configs with the same
+        connection parameters, so closing a connection returns it to the pool.
         """
-        import re
-
         from adbc_driver_gizmosql import dbapi as gizmosql
 
-        def connect() -> t.Any:
-            # Build the URI for the Flight SQL connection
-            protocol = "grpc+tls" if self.use_encryption else "grpc"
-            uri = f"{protocol}://{self.host}:{self.port}"
-
-            connect_kwargs: t.Dict[str, t.Any] = {"uri": uri}
-            if self.auth_type:
-                connect_kwargs["auth_type"] = self.auth_type
-            if self.username:
-                connect_kwargs["username"] = self.username
-                connect_kwargs["password"] = self.password or ""
-            if self.use_encryption and self.disable_certificate_verification:
-                connect_kwargs["tls_skip_verify"] = True
+        connect_kwargs = self._flight_sql_connect_kwargs
+        pool_key = self._pool_key
 
+        def raw_connect() -> t.Any:
             conn = gizmosql.connect(**connect_kwargs)
-
-            # Verify the backend is DuckDB - this adapter only supports the DuckDB backend
-            vendor_version = conn.adbc_get_info().get("vendor_version", "")
-            if not re.search(pattern=r"^duckdb ", string=vendor_version):
-                conn.close()
-                raise ConfigError(
-                    f"Unsupported GizmoSQL server backend: '{vendor_version}'. "
-                    "This adapter only supports the DuckDB backend for GizmoSQL."
-                )
-
+            if not self.skip_vendor_check:
+                _verify_duckdb_backend(conn, (self.host, self.port))
             return conn
 
+        def connect() -> t.Any:
+            pool = _get_pool(
+                pool_key, raw_connect, size=self.concurrent_tasks, pre_ping=self.pre_ping
+            )
+            return pool.connect()
+
         return connect
 
     def get_catalog(self) -> t.Optional[str]:
         return self.database
+
+
+# Importing either submodule directly (rather than through the package's lazy
+# attributes) must still register GizmoSQL with SQLMesh.
+from sqlmesh_gizmosql import register  # noqa: E402
+
+register()
@@ -7,32 +7,76 @@ to be reachable at ``$POSTGRES_HOST:$POSTGRES_PORT`` for the DuckLake
 tests; ``docker compose -f tests/integration/docker/compose.gizmosql.yaml
 up -d`` still brings that up, and CI continues to launch postgres as a
 service container.
+
+All fixtures are session-scoped, so every integration module shares one
+server and one adapter connection. ``gizmosql`` is imported on first use
+of ``gizmosql_server``, so unit-only runs (``-m "not integration"``) don't
+need it importable and never start a server.
 """
 
 from __future__ import annotations
 
+import contextlib
 import typing as t
 
-import gizmosql
 import pytest
 
 from sqlmesh_gizmosql import GizmoSQLConnectionConfig, GizmoSQLEngineAdapter
 
+if t.TYPE_CHECKING:
+    import gizmosql
+
+
+@contextlib.contextmanager
+def _install_lock(tmp_path_factory: pytest.TempPathFactory) -> t.Iterator[None]:
+    """Serialize the server binary download across pytest-xdist workers.
+
+    ``gizmosql.Server()`` downloads and unpacks the binary into a shared
+    cache directory on first use, and workers doing that at once can run a
+    half-written binary. The parent of the base temp directory is shared by
+    every worker of a run. ``fcntl`` is POSIX-only; elsewhere no lock is taken.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+
+    lock_path = tmp_path_factory.getbasetemp().parent / "gizmosql-install.lock"
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
 
 @pytest.fixture(scope="session")
-def gizmosql_server() -> t.Generator[gizmosql.Server, None, None]:
+def gizmosql_server(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> t.Generator[gizmosql.Server, None, None]:
     """Start a GizmoSQL server as a subprocess for the duration of the
     pytest session. Auto-picks a free port."""
-    with gizmosql.Server(
-        username="gizmosql_user",
-        password="gizmosql_password",
-    ) as srv:
+    import gizmosql
+
+    # The binary is fetched when the server is constructed, so only that is
+    # serialized; every worker still starts its own server concurrently.
+    with _install_lock(tmp_path_factory):
+        server = gizmosql.Server(
+            username="gizmosql_user",
+            password="gizmosql_password",
+        )
+    with server as srv:
         yield srv
 
 
 @pytest.fixture(scope="session")
 def gizmosql_config(gizmosql_server: gizmosql.Server) -> GizmoSQLConnectionConfig:
-    """Connection config pointing at the test server."""
+    """Connection config pointing at the test server.
+
+    The subprocess server listens on localhost without TLS, so the tests
+    connect over plain ``grpc://`` and pay no per-RPC encryption cost.
+    """
     return GizmoSQLConnectionConfig(
         host=gizmosql_server.host,
         port=gizmosql_server.port,
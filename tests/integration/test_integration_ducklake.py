@@ -10,7 +10,10 @@ To run locally:
     2. Run: ``pytest -m ducklake tests/integration/test_integration_ducklake.py -v``
 """
 
+import contextlib
+import os
 import typing as t
+import uuid
 
 import pytest
 from sqlglot import exp
@@ -25,180 +28,224 @@ pytestmark = [pytest.mark.integration, pytest.mark.ducklake]
 # =============================================================================
 
 
-class TestDuckDBNonDefaultCatalog:
-    """Tests for creating schemas and tables in non-default DuckDB catalogs."""
+def _unique_name(prefix: str) -> str:
+    """Return a schema name that no other test uses.
 
-    def _ensure_catalog_detached(self, adapter: GizmoSQLEngineAdapter, catalog_name: str) -> None:
-        """Helper to ensure a catalog is detached before attaching."""
-        try:
-            adapter.execute(f"DETACH {catalog_name}")
-        except Exception:
-            pass  # Catalog might not exist, that's OK
+    Names are also unique across runs, because committed DuckLake schemas persist in the
+    shared PostgreSQL metadata.
+    """
+    return f"{prefix}_{uuid.uuid4().hex[:8]}"
 
-    def _attach_memory_catalog(self, adapter: GizmoSQLEngineAdapter, catalog_name: str) -> None:
-        """Helper to attach an in-memory catalog, detaching first if needed."""
-        self._ensure_catalog_detached(adapter, catalog_name)
-        adapter.execute(f"ATTACH ':memory:' AS {catalog_name}")
 
-    def test_create_database_catalog(self, gizmosql_adapter: GizmoSQLEngineAdapter):
-        """Test creating a new DuckDB database (catalog) using ATTACH."""
-        catalog_name = "test_create_cat"
+_SCHEMA_EXISTS_SQL = (
+    "SELECT 1 FROM information_schema.schemata WHERE catalog_name = ? AND schema_name = ?"
+)
+_CATALOG_EXISTS_SQL = "SELECT 1 FROM duckdb_databases() WHERE database_name = ?"
 
-        try:
-            # Create the catalog using ATTACH (DuckDB syntax for creating additional catalogs)
-            self._attach_memory_catalog(gizmosql_adapter, catalog_name)
 
-            # Verify it exists
-            result = gizmosql_adapter.fetchall("SELECT database_name FROM duckdb_databases()")
-            catalog_names = [row[0] for row in result]
-            assert catalog_name in catalog_names
+def _open_probe_cursor(adapter: GizmoSQLEngineAdapter) -> t.Generator[t.Any, None, None]:
+    # Opened on the adapter's connection, so a probe sees the uncommitted work inside a
+    # test's transaction.
+    cursor = adapter.connection.cursor()
+    yield cursor
+    cursor.close()
 
-        finally:
-            self._ensure_catalog_detached(gizmosql_adapter, catalog_name)
 
-    def test_create_schema_in_non_default_catalog(self, gizmosql_adapter: GizmoSQLEngineAdapter):
-        """Test creating a schema in a non-default catalog."""
-        catalog_name = "test_schema_cat"
-        schema_name = "custom_schema"
+@pytest.fixture(scope="session")
+def schema_probe_cursor(
+    gizmosql_adapter: GizmoSQLEngineAdapter,
+) -> t.Generator[t.Any, None, None]:
+    """A cursor that only ever runs ``_SCHEMA_EXISTS_SQL``.
 
-        try:
-            # Create the catalog using ATTACH
-            self._attach_memory_catalog(gizmosql_adapter, catalog_name)
-
-            # Create schema in the non-default catalog
-            gizmosql_adapter.execute(f"CREATE SCHEMA {catalog_name}.{schema_name}")
-
-            # Verify the schema exists
-            result = gizmosql_adapter.fetchone(
-                f"""
-                SELECT schema_name
-                FROM information_schema.schemata
-                WHERE catalog_name = '{catalog_name}' AND schema_name = '{schema_name}'
-                """
-            )
-            assert result is not None
-            assert result[0] == schema_name
+    An ADBC cursor only reuses its prepared statement while it keeps executing the same
+    SQL text, so the probe gets a cursor of its own that is prepared once and afterwards
+    just binds new parameters.
+    """
+    yield from _open_probe_cursor(gizmosql_adapter)
 
-        finally:
-            self._ensure_catalog_detached(gizmosql_adapter, catalog_name)
 
-    def test_create_table_in_non_default_catalog(self, gizmosql_adapter: GizmoSQLEngineAdapter):
-        """Test creating a table in a non-default catalog."""
-        catalog_name = "test_table_cat"
-        schema_name = "test_schema"
-        table_name = f"{catalog_name}.{schema_name}.test_table"
+@pytest.fixture(scope="session")
+def catalog_probe_cursor(
+    gizmosql_adapter: GizmoSQLEngineAdapter,
+) -> t.Generator[t.Any, None, None]:
+    """Like ``schema_probe_cursor``, for ``_CATALOG_EXISTS_SQL``."""
+    yield from _open_probe_cursor(gizmosql_adapter)
 
-        try:
-            # Create the catalog using ATTACH
-            self._attach_memory_catalog(gizmosql_adapter, catalog_name)
 
-            # Create schema and table using adapter methods
-            gizmosql_adapter.execute(f"CREATE SCHEMA {catalog_name}.{schema_name}")
+def _probe(cursor: t.Any, sql: str, parameters: t.Tuple[str, ...]) -> bool:
+    cursor.execute(sql, parameters)
+    return cursor.fetchone() is not None
 
-            columns_to_types = {
-                "id": exp.DataType.build("INT"),
-                "name": exp.DataType.build("VARCHAR"),
-                "value": exp.DataType.build("DOUBLE"),
-            }
-            gizmosql_adapter.create_table(table_name, columns_to_types)
 
-            # Insert data
-            gizmosql_adapter.execute(
-                f"INSERT INTO {table_name} (id, name, value) VALUES (1, 'test', 3.14)"
-            )
+def _schema_exists(cursor: t.Any, catalog: str, schema: str) -> bool:
+    return _probe(cursor, _SCHEMA_EXISTS_SQL, (catalog, schema))
 
-            # Query data
-            result = gizmosql_adapter.fetchone(f"SELECT * FROM {table_name}")
-            assert result is not None
-            assert result[0] == 1
-            assert result[1] == "test"
-            assert abs(result[2] - 3.14) < 0.001
 
-        finally:
-            self._ensure_catalog_detached(gizmosql_adapter, catalog_name)
+def _catalog_exists(cursor: t.Any, catalog: str) -> bool:
+    return _probe(cursor, _CATALOG_EXISTS_SQL, (catalog,))
 
-    def test_table_exists_in_non_default_catalog(self, gizmosql_adapter: GizmoSQLEngineAdapter):
-        """Test checking if a table exists in a non-default catalog."""
-        catalog_name = "test_exists_cat"
-        schema_name = "exists_test_schema"
-        table_name = f"{catalog_name}.{schema_name}.exists_test_table"
 
-        try:
-            # Create the catalog using ATTACH and schema
-            self._attach_memory_catalog(gizmosql_adapter, catalog_name)
-            gizmosql_adapter.execute(f"CREATE SCHEMA {catalog_name}.{schema_name}")
+def _fetch_row_with_schema_probe(
+    adapter: GizmoSQLEngineAdapter, catalog: str, schema: str, table: str
+) -> t.Tuple[t.Any, ...]:
+    """Fetch whether ``catalog.schema`` exists, followed by the first row of ``table``.
 
-            # Table should not exist yet
-            assert not gizmosql_adapter.table_exists(exp.to_table(table_name))
+    Both checks share one round-trip and one scan of the table. The SQL differs per
+    table, so it runs on the adapter's cursor rather than on a probe cursor.
+    """
+    cursor = adapter.cursor
+    cursor.execute(f"SELECT EXISTS({_SCHEMA_EXISTS_SQL}), * FROM {table}", (catalog, schema))
+    row = cursor.fetchone()
+    assert row is not None
+    return tuple(row)
 
-            # Create table
-            columns_to_types = {"id": exp.DataType.build("INT")}
-            gizmosql_adapter.create_table(table_name, columns_to_types)
 
-            # Table should exist now
-            assert gizmosql_adapter.table_exists(exp.to_table(table_name))
+@pytest.fixture(scope="module")
+def shared_memory_catalog(
+    gizmosql_adapter: GizmoSQLEngineAdapter,
+) -> t.Generator[str, None, None]:
+    """Attach one in-memory catalog for the non-default catalog tests.
 
-        finally:
-            self._ensure_catalog_detached(gizmosql_adapter, catalog_name)
+    Each test works in its own uniquely-named schema, so the catalog is attached
+    once per module instead of attached and detached around every test.
+    """
+    catalog_name = "test_shared_cat"
+    gizmosql_adapter.execute(f"ATTACH ':memory:' AS {catalog_name}")
+    yield catalog_name
+    gizmosql_adapter.execute(f"DETACH {catalog_name}")
 
-    def test_ctas_in_non_default_catalog(self, gizmosql_adapter: GizmoSQLEngineAdapter):
-        """Test CREATE TABLE AS SELECT in a non-default catalog."""
-        catalog_name = "test_ctas_cat"
-        schema_name = "ctas_schema"
-        table_name = f"{catalog_name}.{schema_name}.ctas_table"
 
-        try:
-            # Create the catalog using ATTACH and schema
-            self._attach_memory_catalog(gizmosql_adapter, catalog_name)
-            gizmosql_adapter.execute(f"CREATE SCHEMA {catalog_name}.{schema_name}")
+class TestDuckDBNonDefaultCatalog:
+    """Tests for creating schemas and tables in non-default DuckDB catalogs."""
 
-            # Use CTAS
-            columns_to_types = {
-                "id": exp.DataType.build("INT"),
-                "value": exp.DataType.build("VARCHAR"),
-            }
-            query = exp.select(
-                exp.Literal.number(1).as_("id"),
-                exp.Literal.string("hello").as_("value"),
-            )
-            gizmosql_adapter.ctas(table_name, query, columns_to_types)
+    def test_create_database_catalog(self, shared_memory_catalog: str, catalog_probe_cursor: t.Any):
+        """Test that a DuckDB database (catalog) created using ATTACH is listed."""
+        catalog_name = shared_memory_catalog
 
-            # Verify data
-            result = gizmosql_adapter.fetchone(f"SELECT * FROM {table_name}")
-            assert result is not None
-            assert result[0] == 1
-            assert result[1] == "hello"
+        # Verify it exists
+        assert _catalog_exists(catalog_probe_cursor, catalog_name)
 
-        finally:
-            self._ensure_catalog_detached(gizmosql_adapter, catalog_name)
+    def test_create_schema_in_non_default_catalog(
+        self,
+        gizmosql_adapter: GizmoSQLEngineAdapter,
+        shared_memory_catalog: str,
+        schema_probe_cursor: t.Any,
+    ):
+        """Test creating a schema in a non-default catalog."""
+        catalog_name = shared_memory_catalog
+        schema_name = _unique_name("custom_schema")
 
-    def test_use_catalog_switching(self, gizmosql_adapter: GizmoSQLEngineAdapter):
-        """Test switching between catalogs with USE statement."""
-        catalog_name = "test_switch_cat"
+        # Create schema in the non-default catalog
+        gizmosql_adapter.execute(f"CREATE SCHEMA {catalog_name}.{schema_name}")
 
-        try:
-            # Create the secondary catalog using ATTACH
-            self._attach_memory_catalog(gizmosql_adapter, catalog_name)
+        # Verify the schema exists
+        assert _schema_exists(schema_probe_cursor, catalog_name, schema_name)
+
+    def test_create_table_in_non_default_catalog(
+        self, gizmosql_adapter: GizmoSQLEngineAdapter, shared_memory_catalog: str
+    ):
+        """Test creating a table in a non-default catalog."""
+        catalog_name = shared_memory_catalog
+        schema_name = _unique_name("test_schema")
+        table_name = f"{catalog_name}.{schema_name}.test_table"
+
+        # Create schema and table using adapter methods
+        gizmosql_adapter.execute(f"CREATE SCHEMA {catalog_name}.{schema_name}")
+
+        columns_to_types = {
+            "id": exp.DataType.build("INT"),
+            "name": exp.DataType.build("VARCHAR"),
+            "value": exp.DataType.build("DOUBLE"),
+        }
+        gizmosql_adapter.create_table(table_name, columns_to_types)
+
+        # Insert data
+        gizmosql_adapter.execute(
+            f"INSERT INTO {table_name} (id, name, value) VALUES (1, 'test', 3.14)"
+        )
+
+        # Query data
+        result = gizmosql_adapter.fetchone(f"SELECT * FROM {table_name}")
+        assert result is not None
+        assert result[0] == 1
+        assert result[1] == "test"
+        assert abs(result[2] - 3.14) < 0.001
+
+    def test_table_exists_in_non_default_catalog(
+        self, gizmosql_adapter: GizmoSQLEngineAdapter, shared_memory_catalog: str
+    ):
+        """Test checking if a table exists in a non-default catalog."""
+        catalog_name = shared_memory_catalog
+        schema_name = _unique_name("exists_test_schema")
+        table_name = f"{catalog_name}.{schema_name}.exists_test_table"
+
+        gizmosql_adapter.execute(f"CREATE SCHEMA {catalog_name}.{schema_name}")
+
+        # Table should not exist yet
+        assert not gizmosql_adapter.table_exists(exp.to_table(table_name))
+
+        # Create table
+        columns_to_types = {"id": exp.DataType.build("INT")}
+        gizmosql_adapter.create_table(table_name, columns_to_types)
+
+        # Table should exist now
+        assert gizmosql_adapter.table_exists(exp.to_table(table_name))
+
+    def test_ctas_in_non_default_catalog(
+        self, gizmosql_adapter: GizmoSQLEngineAdapter, shared_memory_catalog: str
+    ):
+        """Test CREATE TABLE AS SELECT in a non-default catalog."""
+        catalog_name = shared_memory_catalog
+        schema_name = _unique_name("ctas_schema")
+        table_name = f"{catalog_name}.{schema_name}.ctas_table"
 
-            # Get original catalog
-            original_catalog = gizmosql_adapter.get_current_catalog()
-            assert original_catalog is not None
+        gizmosql_adapter.execute(f"CREATE SCHEMA {catalog_name}.{schema_name}")
+
+        # Use CTAS
+        columns_to_types = {
+            "id": exp.DataType.build("INT"),
+            "value": exp.DataType.build("VARCHAR"),
+        }
+        query = exp.select(
+            exp.Literal.number(1).as_("id"),
+            exp.Literal.string("hello").as_("value"),
+        )
+        gizmosql_adapter.ctas(table_name, query, columns_to_types)
+
+        # Verify data
+        result = gizmosql_adapter.fetchone(f"SELECT * FROM {table_name}")
+        assert result is not None
+        assert result[0] == 1
+        assert result[1] == "hello"
+
+    def test_use_catalog_switching(
+        self, gizmosql_adapter: GizmoSQLEngineAdapter, shared_memory_catalog: str
+    ):
+        """Test switching between catalogs with USE statement."""
+        catalog_name = shared_memory_catalog
+
+        # Get original catalog
+        original_catalog = gizmosql_adapter.get_current_catalog()
+        assert original_catalog is not None
 
+        try:
             # Switch to secondary catalog
             gizmosql_adapter.set_current_catalog(catalog_name)
             current = gizmosql_adapter.get_current_catalog()
             assert current == catalog_name
 
-            # Switch back
+        finally:
+            # Switch back so later tests keep the default catalog
             gizmosql_adapter.set_current_catalog(original_catalog)
-            current = gizmosql_adapter.get_current_catalog()
-            assert current == original_catalog
 
-        finally:
-            self._ensure_catalog_detached(gizmosql_adapter, catalog_name)
+        current = gizmosql_adapter.get_current_catalog()
+        assert current == original_catalog
 
     def test_auto_create_schema_in_non_default_catalog(
-        self, gizmosql_adapter: GizmoSQLEngineAdapter
+        self,
+        gizmosql_adapter: GizmoSQLEngineAdapter,
+        shared_memory_catalog: str,
+        schema_probe_cursor: t.Any,
     ):
         """Test that create_table auto-creates schema in non-default catalog.
 
@@ -207,104 +254,67 @@ class TestDuckDBNonDefaultCatalog:
 
         The adapter should automatically create the schema in the correct catalog.
         """
-        catalog_name = "test_auto_schema_cat"
-        schema_name = "auto_created_schema"
+        catalog_name = shared_memory_catalog
+        schema_name = _unique_name("auto_created_schema")
         table_name = f"{catalog_name}.{schema_name}.auto_test_table"
 
-        try:
-            # Create the catalog but NOT the schema
-            self._attach_memory_catalog(gizmosql_adapter, catalog_name)
-
-            # Verify schema does NOT exist
-            result = gizmosql_adapter.fetchone(
-                f"""
-                SELECT schema_name FROM information_schema.schemata
-                WHERE catalog_name = '{catalog_name}' AND schema_name = '{schema_name}'
-                """
-            )
-            assert result is None, "Schema should not exist before test"
-
-            # Create table - this should auto-create the schema in the correct catalog
-            columns_to_types = {
-                "id": exp.DataType.build("INT"),
-                "name": exp.DataType.build("VARCHAR"),
-            }
-            gizmosql_adapter.create_table(table_name, columns_to_types)
-
-            # Verify schema was auto-created in the correct catalog
-            result = gizmosql_adapter.fetchone(
-                f"""
-                SELECT schema_name FROM information_schema.schemata
-                WHERE catalog_name = '{catalog_name}' AND schema_name = '{schema_name}'
-                """
-            )
-            assert result is not None, (
-                "Schema should have been auto-created in the non-default catalog"
-            )
-            assert result[0] == schema_name
-
-            # Verify table is usable
-            gizmosql_adapter.execute(f"INSERT INTO {table_name} (id, name) VALUES (1, 'test')")
-            result = gizmosql_adapter.fetchone(f"SELECT * FROM {table_name}")
-            assert result is not None
-            assert result[0] == 1
-
-        finally:
-            self._ensure_catalog_detached(gizmosql_adapter, catalog_name)
+        # Verify schema does NOT exist
+        assert not _schema_exists(schema_probe_cursor, catalog_name, schema_name), (
+            "Schema should not exist before test"
+        )
+
+        # Create table - this should auto-create the schema in the correct catalog
+        columns_to_types = {
+            "id": exp.DataType.build("INT"),
+            "name": exp.DataType.build("VARCHAR"),
+        }
+        gizmosql_adapter.create_table(table_name, columns_to_types)
+        gizmosql_adapter.execute(f"INSERT INTO {table_name} (id, name) VALUES (1, 'test')")
+
+        # Verify schema was auto-created in the correct catalog and the table is usable
+        schema_created, *row = _fetch_row_with_schema_probe(
+            gizmosql_adapter, catalog_name, schema_name, table_name
+        )
+        assert schema_created, "Schema should have been auto-created in the non-default catalog"
+        assert row == [1, "test"]
 
     def test_ctas_auto_create_schema_in_non_default_catalog(
-        self, gizmosql_adapter: GizmoSQLEngineAdapter
+        self,
+        gizmosql_adapter: GizmoSQLEngineAdapter,
+        shared_memory_catalog: str,
+        schema_probe_cursor: t.Any,
     ):
         """Test that CTAS auto-creates schema in non-default catalog.
 
         This tests the exact scenario from the customer error:
         CREATE TABLE IF NOT EXISTS "catalog"."sqlmesh__duck"."table" AS SELECT ...
         """
-        catalog_name = "test_ctas_auto_cat"
-        schema_name = "sqlmesh__duck"  # Use the actual SQLMesh schema name
+        catalog_name = shared_memory_catalog
+        schema_name = _unique_name("sqlmesh__duck")  # Based on the actual SQLMesh schema name
         table_name = f"{catalog_name}.{schema_name}.ctas_auto_table"
 
-        try:
-            # Create the catalog but NOT the schema
-            self._attach_memory_catalog(gizmosql_adapter, catalog_name)
-
-            # Verify schema does NOT exist
-            result = gizmosql_adapter.fetchone(
-                f"""
-                SELECT schema_name FROM information_schema.schemata
-                WHERE catalog_name = '{catalog_name}' AND schema_name = '{schema_name}'
-                """
-            )
-            assert result is None, "Schema should not exist before test"
-
-            # Use CTAS - this should auto-create the schema in the correct catalog
-            columns_to_types = {
-                "id": exp.DataType.build("INT"),
-                "value": exp.DataType.build("VARCHAR"),
-            }
-            query = exp.select(
-                exp.Literal.number(42).as_("id"),
-                exp.Literal.string("auto_created").as_("value"),
-            )
-            gizmosql_adapter.ctas(table_name, query, columns_to_types)
-
-            # Verify schema was auto-created
-            result = gizmosql_adapter.fetchone(
-                f"""
-                SELECT schema_name FROM information_schema.schemata
-                WHERE catalog_name = '{catalog_name}' AND schema_name = '{schema_name}'
-                """
-            )
-            assert result is not None, "Schema should have been auto-created"
-
-            # Verify data
-            result = gizmosql_adapter.fetchone(f"SELECT * FROM {table_name}")
-            assert result is not None
-            assert result[0] == 42
-            assert result[1] == "auto_created"
-
-        finally:
-            self._ensure_catalog_detached(gizmosql_adapter, catalog_name)
+        # Verify schema does NOT exist
+        assert not _schema_exists(schema_probe_cursor, catalog_name, schema_name), (
+            "Schema should not exist before test"
+        )
+
+        # Use CTAS - this should auto-create the schema in the correct catalog
+        columns_to_types = {
+            "id": exp.DataType.build("INT"),
+            "value": exp.DataType.build("VARCHAR"),
+        }
+        query = exp.select(
+            exp.Literal.number(42).as_("id"),
+            exp.Literal.string("auto_created").as_("value"),
+        )
+        gizmosql_adapter.ctas(table_name, query, columns_to_types)
+
+        # Verify schema was auto-created and the data landed
+        schema_created, *row = _fetch_row_with_schema_probe(
+            gizmosql_adapter, catalog_name, schema_name, table_name
+        )
+        assert schema_created, "Schema should have been auto-created"
+        assert row == [42, "auto_created"]
 
 
 # =============================================================================
@@ -312,214 +322,247 @@ class TestDuckDBNonDefaultCatalog:
 # =============================================================================
 
 
-class TestDuckLake:
-    """Tests for DuckLake extension with PostgreSQL metadata storage."""
+# Each pytest-xdist worker starts its own GizmoSQL server, so the only state workers
+# share is PostgreSQL and the data path. Suffixing both with the worker id keeps
+# parallel DuckLake catalogs from colliding.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "")
+DUCKLAKE_METADATA_SCHEMA = f"gizmosql_test_{_XDIST_WORKER}" if _XDIST_WORKER else "gizmosql_test"
+DUCKLAKE_DATA_PATH = os.path.join("/tmp/ducklake", _XDIST_WORKER, "")
 
-    @pytest.fixture(scope="class")
-    def ducklake_setup(
-        self, gizmosql_adapter: GizmoSQLEngineAdapter
-    ) -> t.Generator[str, None, None]:
-        """Setup DuckLake with PostgreSQL metadata backend."""
-        import os
 
-        ducklake_catalog = "my_ducklake"
-        postgres_host = os.environ.get("POSTGRES_HOST", "postgres")
-        postgres_port = os.environ.get("POSTGRES_PORT", "5432")
-        postgres_db = os.environ.get("POSTGRES_DB", "ducklake_catalog")
-        postgres_user = os.environ.get("POSTGRES_USER", "postgres")
-        postgres_password = os.environ.get("POSTGRES_PASSWORD", "mysecretpassword")
+# PostgreSQL connection for the DuckLake metadata store, read once at import
+_POSTGRES_HOST = os.environ.get("POSTGRES_HOST", "postgres")
+_POSTGRES_PORT = os.environ.get("POSTGRES_PORT", "5432")
+_POSTGRES_DB = os.environ.get("POSTGRES_DB", "ducklake_catalog")
+_POSTGRES_USER = os.environ.get("POSTGRES_USER", "postgres")
+_POSTGRES_PASSWORD = os.environ.get("POSTGRES_PASSWORD", "mysecretpassword")
+
+DUCKLAKE_CATALOG = "my_ducklake"
 
+
+# PostgreSQL secret for DuckLake metadata
+_POSTGRES_SECRET_SQL = f"""
+CREATE OR REPLACE SECRET postgres_secret (
+    TYPE postgres,
+    HOST '{_POSTGRES_HOST}',
+    PORT {_POSTGRES_PORT},
+    DATABASE '{_POSTGRES_DB}',
+    USER '{_POSTGRES_USER}',
+    PASSWORD '{_POSTGRES_PASSWORD}'
+)
+"""
+
+# DuckLake secret (use /tmp for data storage in container)
+_DUCKLAKE_SECRET_SQL = f"""
+CREATE OR REPLACE SECRET ducklake_secret (
+    TYPE DUCKLAKE,
+    METADATA_PATH '',
+    DATA_PATH '{DUCKLAKE_DATA_PATH}',
+    METADATA_SCHEMA '{DUCKLAKE_METADATA_SCHEMA}',
+    METADATA_PARAMETERS MAP {{
+        'TYPE': 'postgres',
+        'SECRET': 'postgres_secret',
+        'SCHEMA': '{DUCKLAKE_METADATA_SCHEMA}'
+    }}
+)
+"""
+
+_ATTACH_STATEMENTS = [
+    # Keep the DuckLake metadata tables in their own PostgreSQL schema. Passing
+    # that schema through to the postgres extension means ATTACH only reflects
+    # this one namespace instead of every relation in the database.
+    "ATTACH '' AS ducklake_pg (TYPE postgres, SECRET postgres_secret)",
+    "CALL postgres_execute('ducklake_pg', "
+    f"'CREATE SCHEMA IF NOT EXISTS {DUCKLAKE_METADATA_SCHEMA}')",
+    "DETACH ducklake_pg",
+    # Attach DuckLake catalog
+    f"ATTACH 'ducklake:ducklake_secret' AS {DUCKLAKE_CATALOG}",
+]
+
+
+@pytest.fixture(scope="session")
+def ducklake_extensions(gizmosql_adapter: GizmoSQLEngineAdapter) -> None:
+    """Install and load the DuckLake and PostgreSQL extensions once per session.
+
+    INSTALL is served from DuckDB's extension directory (``~/.duckdb/extensions``)
+    once the extensions have been downloaded, so warm runs skip the download; CI
+    caches that directory between runs.
+    """
+    gizmosql_adapter.execute("INSTALL ducklake")
+    gizmosql_adapter.execute("INSTALL postgres")
+    gizmosql_adapter.execute("LOAD ducklake")
+    gizmosql_adapter.execute("LOAD postgres")
+
+
+@pytest.fixture(scope="session")
+def ducklake_setup(
+    gizmosql_adapter: GizmoSQLEngineAdapter, ducklake_extensions: None
+) -> t.Generator[str, None, None]:
+    """Setup DuckLake with PostgreSQL metadata backend.
+
+    The catalog is attached once per session. Every test uses its own schema
+    names, so tests stay isolated without re-attaching the catalog. Keeping the
+    ATTACH live also lets the postgres extension's connection cache
+    (``pg_connection_cache``, on by default) reuse one warm libpq connection to
+    the metadata store for the whole session, instead of reconnecting per class.
+    """
+    try:
+        for sql in (_POSTGRES_SECRET_SQL, _DUCKLAKE_SECRET_SQL, *_ATTACH_STATEMENTS):
+            gizmosql_adapter.execute(sql)
+
+        yield DUCKLAKE_CATALOG
+
+    finally:
+        # Cleanup
         try:
-            # Install required extensions
-            gizmosql_adapter.execute("INSTALL ducklake")
-            gizmosql_adapter.execute("INSTALL postgres")
-            gizmosql_adapter.execute("LOAD ducklake")
-            gizmosql_adapter.execute("LOAD postgres")
-
-            # Create PostgreSQL secret for DuckLake metadata
-            gizmosql_adapter.execute(f"""
-                CREATE OR REPLACE SECRET postgres_secret (
-                    TYPE postgres,
-                    HOST '{postgres_host}',
-                    PORT {postgres_port},
-                    DATABASE '{postgres_db}',
-                    USER '{postgres_user}',
-                    PASSWORD '{postgres_password}'
-                )
-            """)
-
-            # Create DuckLake secret (use /tmp for data storage in container)
-            gizmosql_adapter.execute("""
-                CREATE OR REPLACE SECRET ducklake_secret (
-                    TYPE DUCKLAKE,
-                    METADATA_PATH '',
-                    DATA_PATH '/tmp/ducklake/',
-                    METADATA_PARAMETERS MAP {'TYPE': 'postgres', 'SECRET': 'postgres_secret'}
-                )
-            """)
+            gizmosql_adapter.execute(f"DETACH {DUCKLAKE_CATALOG}")
+        except Exception:
+            pass
 
-            # Attach DuckLake catalog
-            gizmosql_adapter.execute(f"ATTACH 'ducklake:ducklake_secret' AS {ducklake_catalog}")
 
-            yield ducklake_catalog
+@contextlib.contextmanager
+def _rolled_back_transaction(adapter: GizmoSQLEngineAdapter) -> t.Iterator[None]:
+    """Run the block in a transaction that is always rolled back.
 
-        finally:
-            # Cleanup
-            try:
-                gizmosql_adapter.execute(f"DETACH {ducklake_catalog}")
-            except Exception:
-                pass
+    ``adapter.transaction()`` only rolls back on error, so its steps are repeated here.
+    That includes marking the transaction on the adapter's connection pool, so adapter
+    methods that open their own transaction join this one instead of issuing a nested
+    BEGIN.
+    """
+    adapter._connection_pool.begin()
+    adapter.execute("BEGIN TRANSACTION")
+    try:
+        yield
+    finally:
+        adapter.execute("ROLLBACK")
+        adapter._connection_pool.rollback()
+
+
+@pytest.mark.xdist_group("ducklake")
+class TestDuckLake:
+    """Tests for DuckLake extension with PostgreSQL metadata storage."""
 
-    def test_ducklake_attach(self, gizmosql_adapter: GizmoSQLEngineAdapter, ducklake_setup: str):
+    @pytest.fixture(autouse=True)
+    def rollback_after_test(
+        self,
+        request: pytest.FixtureRequest,
+        gizmosql_adapter: GizmoSQLEngineAdapter,
+        ducklake_setup: str,
+    ) -> t.Generator[None, None, None]:
+        """Run each test in a transaction that is rolled back afterwards.
+
+        DuckLake only writes metadata to PostgreSQL on commit, so rolling back
+        discards the schemas and tables a test created without any DROP round-trips.
+        DuckDB has no SAVEPOINT support, so a whole transaction is used instead.
+        Tests marked ``ducklake_commit`` run outside it and clean up after themselves.
+        """
+        if request.node.get_closest_marker("ducklake_commit"):
+            yield
+            return
+        with _rolled_back_transaction(gizmosql_adapter):
+            yield
+
+    def test_ducklake_attach(self, ducklake_setup: str, catalog_probe_cursor: t.Any):
         """Test that DuckLake catalog is properly attached."""
         ducklake_catalog = ducklake_setup
 
         # Check that the catalog appears in the list
-        result = gizmosql_adapter.fetchall("SELECT database_name FROM duckdb_databases()")
-        catalog_names = [row[0] for row in result]
-        assert ducklake_catalog in catalog_names
+        assert _catalog_exists(catalog_probe_cursor, ducklake_catalog)
 
     def test_create_schema_in_ducklake(
-        self, gizmosql_adapter: GizmoSQLEngineAdapter, ducklake_setup: str
+        self,
+        gizmosql_adapter: GizmoSQLEngineAdapter,
+        ducklake_setup: str,
+        schema_probe_cursor: t.Any,
     ):
         """Test creating a schema in the DuckLake catalog."""
         ducklake_catalog = ducklake_setup
-        schema_name = "dl_test_schema"
+        schema_name = _unique_name("dl_test_schema")
 
-        try:
-            # Create schema in DuckLake catalog
-            gizmosql_adapter.execute(
-                f"CREATE SCHEMA IF NOT EXISTS {ducklake_catalog}.{schema_name}"
-            )
-
-            # Verify it exists
-            result = gizmosql_adapter.fetchone(
-                f"""
-                SELECT schema_name
-                FROM information_schema.schemata
-                WHERE catalog_name = '{ducklake_catalog}' AND schema_name = '{schema_name}'
-                """
-            )
-            assert result is not None
-            assert result[0] == schema_name
+        # Create schema in DuckLake catalog
+        gizmosql_adapter.execute(f"CREATE SCHEMA IF NOT EXISTS {ducklake_catalog}.{schema_name}")
 
-        finally:
-            try:
-                gizmosql_adapter.execute(
-                    f"DROP SCHEMA IF EXISTS {ducklake_catalog}.{schema_name} CASCADE"
-                )
-            except Exception:
-                pass
+        # Verify it exists
+        assert _schema_exists(schema_probe_cursor, ducklake_catalog, schema_name)
 
     def test_create_table_in_ducklake(
-        self, gizmosql_adapter: GizmoSQLEngineAdapter, ducklake_setup: str
+        self,
+        gizmosql_adapter: GizmoSQLEngineAdapter,
+        ducklake_setup: str,
     ):
         """Test creating a table in the DuckLake catalog."""
         ducklake_catalog = ducklake_setup
-        schema_name = "dl_table_schema"
+        schema_name = _unique_name("dl_table_schema")
         table_name = f"{ducklake_catalog}.{schema_name}.dl_test_table"
 
-        try:
-            # Create schema
-            gizmosql_adapter.execute(
-                f"CREATE SCHEMA IF NOT EXISTS {ducklake_catalog}.{schema_name}"
-            )
-
-            # Create table
-            columns_to_types = {
-                "id": exp.DataType.build("INT"),
-                "name": exp.DataType.build("VARCHAR"),
-                "created_at": exp.DataType.build("TIMESTAMP"),
-            }
-            gizmosql_adapter.create_table(table_name, columns_to_types)
-
-            # Insert data
-            gizmosql_adapter.execute(
-                f"INSERT INTO {table_name} (id, name, created_at) VALUES (1, 'ducklake_test', '2024-01-01 12:00:00')"
-            )
-
-            # Query data
-            result = gizmosql_adapter.fetchone(f"SELECT id, name FROM {table_name}")
-            assert result is not None
-            assert result[0] == 1
-            assert result[1] == "ducklake_test"
-
-        finally:
-            try:
-                gizmosql_adapter.execute(
-                    f"DROP SCHEMA IF EXISTS {ducklake_catalog}.{schema_name} CASCADE"
-                )
-            except Exception:
-                pass
-
-    def test_ctas_in_ducklake(self, gizmosql_adapter: GizmoSQLEngineAdapter, ducklake_setup: str):
+        # Create table; the adapter creates the schema as part of the same call
+        columns_to_types = {
+            "id": exp.DataType.build("INT"),
+            "name": exp.DataType.build("VARCHAR"),
+            "created_at": exp.DataType.build("TIMESTAMP"),
+        }
+        gizmosql_adapter.create_table(table_name, columns_to_types)
+
+        # Insert data
+        gizmosql_adapter.execute(
+            f"INSERT INTO {table_name} (id, name, created_at) VALUES (1, 'ducklake_test', '2024-01-01 12:00:00')"
+        )
+
+        # Query data
+        result = gizmosql_adapter.fetchone(f"SELECT id, name FROM {table_name}")
+        assert result is not None
+        assert result[0] == 1
+        assert result[1] == "ducklake_test"
+
+    def test_ctas_in_ducklake(
+        self,
+        gizmosql_adapter: GizmoSQLEngineAdapter,
+        ducklake_setup: str,
+    ):
         """Test CREATE TABLE AS SELECT in DuckLake catalog."""
         ducklake_catalog = ducklake_setup
-        schema_name = "dl_ctas_schema"
+        schema_name = _unique_name("dl_ctas_schema")
         table_name = f"{ducklake_catalog}.{schema_name}.dl_ctas_table"
 
-        try:
-            # Create schema
-            gizmosql_adapter.execute(
-                f"CREATE SCHEMA IF NOT EXISTS {ducklake_catalog}.{schema_name}"
-            )
-
-            # Use CTAS
-            columns_to_types = {
-                "id": exp.DataType.build("INT"),
-                "value": exp.DataType.build("VARCHAR"),
-            }
-            query = exp.select(
-                exp.Literal.number(42).as_("id"),
-                exp.Literal.string("ducklake_ctas").as_("value"),
-            )
-            gizmosql_adapter.ctas(table_name, query, columns_to_types)
-
-            # Verify data
-            result = gizmosql_adapter.fetchone(f"SELECT * FROM {table_name}")
-            assert result is not None
-            assert result[0] == 42
-            assert result[1] == "ducklake_ctas"
-
-        finally:
-            try:
-                gizmosql_adapter.execute(
-                    f"DROP SCHEMA IF EXISTS {ducklake_catalog}.{schema_name} CASCADE"
-                )
-            except Exception:
-                pass
+        # Use CTAS; the adapter creates the schema as part of the same call
+        columns_to_types = {
+            "id": exp.DataType.build("INT"),
+            "value": exp.DataType.build("VARCHAR"),
+        }
+        query = exp.select(
+            exp.Literal.number(42).as_("id"),
+            exp.Literal.string("ducklake_ctas").as_("value"),
+        )
+        gizmosql_adapter.ctas(table_name, query, columns_to_types)
+
+        # Verify data
+        result = gizmosql_adapter.fetchone(f"SELECT * FROM {table_name}")
+        assert result is not None
+        assert result[0] == 42
+        assert result[1] == "ducklake_ctas"
 
     def test_table_exists_in_ducklake(
-        self, gizmosql_adapter: GizmoSQLEngineAdapter, ducklake_setup: str
+        self,
+        gizmosql_adapter: GizmoSQLEngineAdapter,
+        ducklake_setup: str,
     ):
         """Test checking if a table exists in DuckLake catalog."""
         ducklake_catalog = ducklake_setup
-        schema_name = "dl_exists_schema"
+        schema_name = _unique_name("dl_exists_schema")
         table_name = f"{ducklake_catalog}.{schema_name}.dl_exists_table"
 
-        try:
-            # Create schema
-            gizmosql_adapter.execute(
-                f"CREATE SCHEMA IF NOT EXISTS {ducklake_catalog}.{schema_name}"
-            )
-
-            # Table should not exist yet
-            assert not gizmosql_adapter.table_exists(exp.to_table(table_name))
+        # Create schema
+        gizmosql_adapter.execute(f"CREATE SCHEMA IF NOT EXISTS {ducklake_catalog}.{schema_name}")
 
-            # Create table
-            columns_to_types = {"id": exp.DataType.build("INT")}
-            gizmosql_adapter.create_table(table_name, columns_to_types)
+        # Table should not exist yet
+        assert not gizmosql_adapter.table_exists(exp.to_table(table_name))
 
-            # Table should exist now
-            assert gizmosql_adapter.table_exists(exp.to_table(table_name))
+        # Create table
+        columns_to_types = {"id": exp.DataType.build("INT")}
+        gizmosql_adapter.create_table(table_name, columns_to_types)
 
-        finally:
-            try:
-                gizmosql_adapter.execute(
-                    f"DROP SCHEMA IF EXISTS {ducklake_catalog}.{schema_name} CASCADE"
-                )
-            except Exception:
-                pass
+        # Table should exist now
+        assert gizmosql_adapter.table_exists(exp.to_table(table_name))
 
     def test_switch_to_ducklake_catalog(
         self, gizmosql_adapter: GizmoSQLEngineAdapter, ducklake_setup: str
@@ -539,125 +582,101 @@ class TestDuckLake:
         gizmosql_adapter.set_current_catalog(original_catalog)
 
     def test_dataframe_bulk_ingestion_to_ducklake(
-        self, gizmosql_adapter: GizmoSQLEngineAdapter, ducklake_setup: str
+        self,
+        gizmosql_adapter: GizmoSQLEngineAdapter,
+        ducklake_setup: str,
     ):
         """Test bulk DataFrame ingestion into a DuckLake table."""
         import pandas as pd
 
         ducklake_catalog = ducklake_setup
-        schema_name = "dl_bulk_schema"
+        schema_name = _unique_name("dl_bulk_schema")
         table_name = f"{ducklake_catalog}.{schema_name}.dl_bulk_table"
 
-        try:
-            # Create schema
-            gizmosql_adapter.execute(
-                f"CREATE SCHEMA IF NOT EXISTS {ducklake_catalog}.{schema_name}"
-            )
-
-            # Create a test DataFrame
-            df = pd.DataFrame(
-                {
-                    "id": [1, 2, 3, 4, 5],
-                    "name": ["alice", "bob", "charlie", "diana", "eve"],
-                    "score": [85.5, 92.0, 78.5, 95.0, 88.5],
-                }
-            )
-
-            # Create target table
-            columns_to_types = {
-                "id": exp.DataType.build("INT"),
-                "name": exp.DataType.build("VARCHAR"),
-                "score": exp.DataType.build("DOUBLE"),
+        # Create a test DataFrame
+        df = pd.DataFrame(
+            {
+                "id": [1, 2, 3, 4, 5],
+                "name": ["alice", "bob", "charlie", "diana", "eve"],
+                "score": [85.5, 92.0, 78.5, 95.0, 88.5],
             }
-            gizmosql_adapter.create_table(table_name, columns_to_types)
-
-            # Use replace_query with DataFrame
-            gizmosql_adapter.replace_query(
-                table_name,
-                df,
-                columns_to_types,
-            )
-
-            # Verify data was loaded
-            result = gizmosql_adapter.fetchall(f"SELECT * FROM {table_name} ORDER BY id")
-            assert len(result) == 5
-            assert result[0][0] == 1
-            assert result[0][1] == "alice"
-
-        finally:
-            try:
-                gizmosql_adapter.execute(
-                    f"DROP SCHEMA IF EXISTS {ducklake_catalog}.{schema_name} CASCADE"
-                )
-            except Exception:
-                pass
-
+        )
+
+        # Create target table (and its schema)
+        columns_to_types = {
+            "id": exp.DataType.build("INT"),
+            "name": exp.DataType.build("VARCHAR"),
+            "score": exp.DataType.build("DOUBLE"),
+        }
+        gizmosql_adapter.create_table(table_name, columns_to_types)
+
+        # Use replace_query with DataFrame
+        gizmosql_adapter.replace_query(
+            table_name,
+            df,
+            columns_to_types,
+        )
+
+        # Verify data was loaded
+        result = gizmosql_adapter.fetchall(f"SELECT * FROM {table_name} ORDER BY id")
+        assert len(result) == 5
+        assert result[0][0] == 1
+        assert result[0][1] == "alice"
+
+    @pytest.mark.ducklake_commit
     def test_auto_create_schema_in_ducklake(
-        self, gizmosql_adapter: GizmoSQLEngineAdapter, ducklake_setup: str
+        self,
+        gizmosql_adapter: GizmoSQLEngineAdapter,
+        ducklake_setup: str,
+        schema_probe_cursor: t.Any,
     ):
         """Test that create_table auto-creates schema in DuckLake catalog.
 
         This tests the exact customer scenario where SQLMesh tries to create:
         CREATE TABLE "ducklake_catalog"."sqlmesh__duck"."table" ...
         but the schema doesn't exist yet.
+
+        Unlike the other DuckLake tests this one commits, so the schema and table are
+        written to the PostgreSQL metadata store and read back from it.
         """
         ducklake_catalog = ducklake_setup
-        schema_name = "sqlmesh__duck"  # Use the actual SQLMesh schema name
+        schema_name = _unique_name("sqlmesh__duck")  # Named like SQLMesh's schemas
         table_name = f"{ducklake_catalog}.{schema_name}.dl_auto_table"
 
-        try:
-            # Ensure schema does NOT exist
-            try:
-                gizmosql_adapter.execute(
-                    f"DROP SCHEMA IF EXISTS {ducklake_catalog}.{schema_name} CASCADE"
-                )
-            except Exception:
-                pass
-
-            # Verify schema doesn't exist
-            result = gizmosql_adapter.fetchone(
-                f"""
-                SELECT schema_name FROM information_schema.schemata
-                WHERE catalog_name = '{ducklake_catalog}' AND schema_name = '{schema_name}'
-                """
-            )
-            assert result is None, "Schema should not exist before test"
+        # Verify schema doesn't exist
+        assert not _schema_exists(schema_probe_cursor, ducklake_catalog, schema_name), (
+            "Schema should not exist before test"
+        )
 
+        try:
             # Create table - this should auto-create the schema in DuckLake
             columns_to_types = {
                 "id": exp.DataType.build("INT"),
                 "name": exp.DataType.build("VARCHAR"),
             }
-            gizmosql_adapter.create_table(table_name, columns_to_types)
-
-            # Verify schema was auto-created in DuckLake
-            result = gizmosql_adapter.fetchone(
-                f"""
-                SELECT schema_name FROM information_schema.schemata
-                WHERE catalog_name = '{ducklake_catalog}' AND schema_name = '{schema_name}'
-                """
-            )
-            assert result is not None, "Schema should have been auto-created in DuckLake catalog"
+            with gizmosql_adapter.transaction():
+                gizmosql_adapter.create_table(table_name, columns_to_types)
+                gizmosql_adapter.execute(
+                    f"INSERT INTO {table_name} (id, name) VALUES (1, 'ducklake_auto')"
+                )
 
-            # Verify table is usable
-            gizmosql_adapter.execute(
-                f"INSERT INTO {table_name} (id, name) VALUES (1, 'ducklake_auto')"
+            # Verify the committed schema and table are usable
+            schema_created, *row = _fetch_row_with_schema_probe(
+                gizmosql_adapter, ducklake_catalog, schema_name, table_name
             )
-            result = gizmosql_adapter.fetchone(f"SELECT * FROM {table_name}")
-            assert result is not None
-            assert result[0] == 1
-            assert result[1] == "ducklake_auto"
+            assert schema_created, "Schema should have been auto-created in DuckLake catalog"
+            assert row == [1, "ducklake_auto"]
 
         finally:
-            try:
-                gizmosql_adapter.execute(
-                    f"DROP SCHEMA IF EXISTS {ducklake_catalog}.{schema_name} CASCADE"
-                )
-            except Exception:
-                pass
+            gizmosql_adapter.drop_schema(
+                f"{ducklake_catalog}.{schema_name}", ignore_if_not_exists=True, cascade=True
+            )
 
     def test_ctas_auto_create_schema_in_ducklake(
-        self, gizmosql_adapter: GizmoSQLEngineAdapter, ducklake_setup: str
+        self,
+        gizmosql_adapter: GizmoSQLEngineAdapter,
+        ducklake_setup: str,
+        schema_probe_cursor: t.Any,
     ):
         """Test that CTAS auto-creates schema in DuckLake catalog.
 
@@ -666,60 +685,31 @@ class TestDuckLake:
         Error: Schema "sqlmesh__duck" not found in DuckLakeCatalog
         """
         ducklake_catalog = ducklake_setup
-        schema_name = "sqlmesh__duck_ctas"
+        schema_name = _unique_name("sqlmesh__duck_ctas")
         table_name = f"{ducklake_catalog}.{schema_name}.dl_ctas_auto_table"
 
-        try:
-            # Ensure schema does NOT exist
-            try:
-                gizmosql_adapter.execute(
-                    f"DROP SCHEMA IF EXISTS {ducklake_catalog}.{schema_name} CASCADE"
-                )
-            except Exception:
-                pass
-
-            # Verify schema doesn't exist
-            result = gizmosql_adapter.fetchone(
-                f"""
-                SELECT schema_name FROM information_schema.schemata
-                WHERE catalog_name = '{ducklake_catalog}' AND schema_name = '{schema_name}'
-                """
-            )
-            assert result is None, "Schema should not exist before test"
-
-            # Use CTAS - this should auto-create the schema in DuckLake
-            columns_to_types = {
-                "id": exp.DataType.build("INT"),
-                "value": exp.DataType.build("VARCHAR"),
-            }
-            query = exp.select(
-                exp.Literal.number(99).as_("id"),
-                exp.Literal.string("ducklake_ctas_auto").as_("value"),
-            )
-            gizmosql_adapter.ctas(table_name, query, columns_to_types)
-
-            # Verify schema was auto-created
-            result = gizmosql_adapter.fetchone(
-                f"""
-                SELECT schema_name FROM information_schema.schemata
-                WHERE catalog_name = '{ducklake_catalog}' AND schema_name = '{schema_name}'
-                """
-            )
-            assert result is not None, "Schema should have been auto-created in DuckLake"
-
-            # Verify data
-            result = gizmosql_adapter.fetchone(f"SELECT * FROM {table_name}")
-            assert result is not None
-            assert result[0] == 99
-            assert result[1] == "ducklake_ctas_auto"
-
-        finally:
-            try:
-                gizmosql_adapter.execute(
-                    f"DROP SCHEMA IF EXISTS {ducklake_catalog}.{schema_name} CASCADE"
-                )
-            except Exception:
-                pass
+        # Verify schema doesn't exist
+        assert not _schema_exists(schema_probe_cursor, ducklake_catalog, schema_name), (
+            "Schema should not exist before test"
+        )
+
+        # Use CTAS - this should auto-create the schema in DuckLake
+        columns_to_types = {
+            "id": exp.DataType.build("INT"),
+            "value": exp.DataType.build("VARCHAR"),
+        }
+        query = exp.select(
+            exp.Literal.number(99).as_("id"),
+            exp.Literal.string("ducklake_ctas_auto").as_("value"),
+        )
+        gizmosql_adapter.ctas(table_name, query, columns_to_types)
+
+        # Verify schema was auto-created and the data landed
+        schema_created, *row = _fetch_row_with_schema_probe(
+            gizmosql_adapter, ducklake_catalog, schema_name, table_name
+        )
+        assert schema_created, "Schema should have been auto-created in DuckLake"
+        assert row == [99, "ducklake_ctas_auto"]
 
 
 # =============================================================================
@@ -730,116 +720,111 @@ class TestDuckLake:
 class TestCrossCatalogOperations:
     """Tests for operations that span multiple catalogs."""
 
-    def _ensure_catalog_detached(self, adapter: GizmoSQLEngineAdapter, catalog_name: str) -> None:
-        """Helper to ensure a catalog is detached."""
-        try:
-            adapter.execute(f"DETACH {catalog_name}")
-        except Exception:
-            pass
-
-    def _attach_memory_catalog(self, adapter: GizmoSQLEngineAdapter, catalog_name: str) -> None:
-        """Helper to attach an in-memory catalog, detaching first if needed."""
-        self._ensure_catalog_detached(adapter, catalog_name)
-        adapter.execute(f"ATTACH ':memory:' AS {catalog_name}")
+    @pytest.fixture(scope="class")
+    def cross_catalogs(
+        self, gizmosql_adapter: GizmoSQLEngineAdapter
+    ) -> t.Generator[t.Tuple[str, str], None, None]:
+        """Attach the two in-memory catalogs once for the whole class.
 
-    def test_query_across_catalogs(self, gizmosql_adapter: GizmoSQLEngineAdapter):
-        """Test querying data across different catalogs."""
+        Each test creates its own schemas inside them, so the catalogs don't need to
+        be attached and detached around every test. Detaching an in-memory catalog
+        discards everything in it, so detaching both at class teardown is the only
+        cleanup the tests need.
+        """
         catalog_a = "cross_cat_a"
         catalog_b = "cross_cat_b"
-
-        try:
-            # Create catalogs using ATTACH and schemas
-            self._attach_memory_catalog(gizmosql_adapter, catalog_a)
-            self._attach_memory_catalog(gizmosql_adapter, catalog_b)
-            gizmosql_adapter.execute(f"CREATE SCHEMA {catalog_a}.schema_a")
-            gizmosql_adapter.execute(f"CREATE SCHEMA {catalog_b}.schema_b")
-
-            # Create table in catalog_a
-            gizmosql_adapter.execute(f"""
-                CREATE TABLE {catalog_a}.schema_a.users (
-                    id INT,
-                    name VARCHAR
-                )
-            """)
-            gizmosql_adapter.execute(f"""
-                INSERT INTO {catalog_a}.schema_a.users VALUES (1, 'alice'), (2, 'bob')
-            """)
-
-            # Create table in catalog_b
-            gizmosql_adapter.execute(f"""
-                CREATE TABLE {catalog_b}.schema_b.orders (
-                    id INT,
-                    user_id INT,
-                    amount DOUBLE
-                )
-            """)
-            gizmosql_adapter.execute(f"""
-                INSERT INTO {catalog_b}.schema_b.orders VALUES (1, 1, 100.0), (2, 2, 200.0)
-            """)
-
-            # Query across catalogs with JOIN
-            result = gizmosql_adapter.fetchall(f"""
-                SELECT u.name, o.amount
-                FROM {catalog_a}.schema_a.users u
-                JOIN {catalog_b}.schema_b.orders o ON u.id = o.user_id
-                ORDER BY u.name
-            """)
-
-            assert len(result) == 2
-            assert result[0][0] == "alice"
-            assert result[0][1] == 100.0
-            assert result[1][0] == "bob"
-            assert result[1][1] == 200.0
-
-        finally:
-            self._ensure_catalog_detached(gizmosql_adapter, catalog_a)
-            self._ensure_catalog_detached(gizmosql_adapter, catalog_b)
-
-    def test_insert_from_different_catalog(self, gizmosql_adapter: GizmoSQLEngineAdapter):
+        gizmosql_adapter.execute(f"ATTACH ':memory:' AS {catalog_a}")
+        gizmosql_adapter.execute(f"ATTACH ':memory:' AS {catalog_b}")
+        yield catalog_a, catalog_b
+        gizmosql_adapter.execute(f"DETACH {catalog_a}")
+        gizmosql_adapter.execute(f"DETACH {catalog_b}")
+
+    def test_query_across_catalogs(
+        self, gizmosql_adapter: GizmoSQLEngineAdapter, cross_catalogs: t.Tuple[str, str]
+    ):
+        """Test querying data across different catalogs."""
+        catalog_a, catalog_b = cross_catalogs
+        schema_a = f"{catalog_a}.schema_a_query"
+        schema_b = f"{catalog_b}.schema_b_query"
+
+        gizmosql_adapter.execute(f"CREATE SCHEMA {schema_a}")
+        gizmosql_adapter.execute(f"CREATE SCHEMA {schema_b}")
+
+        # Create table in catalog_a
+        gizmosql_adapter.execute(f"""
+            CREATE TABLE {schema_a}.users (
+                id INT,
+                name VARCHAR
+            )
+        """)
+        gizmosql_adapter.execute(f"""
+            INSERT INTO {schema_a}.users VALUES (1, 'alice'), (2, 'bob')
+        """)
+
+        # Create table in catalog_b
+        gizmosql_adapter.execute(f"""
+            CREATE TABLE {schema_b}.orders (
+                id INT,
+                user_id INT,
+                amount DOUBLE
+            )
+        """)
+        gizmosql_adapter.execute(f"""
+            INSERT INTO {schema_b}.orders VALUES (1, 1, 100.0), (2, 2, 200.0)
+        """)
+
+        # Query across catalogs with JOIN
+        result = gizmosql_adapter.fetchall(f"""
+            SELECT u.name, o.amount
+            FROM {schema_a}.users u
+            JOIN {schema_b}.orders o ON u.id = o.user_id
+            ORDER BY u.name
+        """)
+
+        assert len(result) == 2
+        assert result[0][0] == "alice"
+        assert result[0][1] == 100.0
+        assert result[1][0] == "bob"
+        assert result[1][1] == 200.0
+
+    def test_insert_from_different_catalog(
+        self, gizmosql_adapter: GizmoSQLEngineAdapter, cross_catalogs: t.Tuple[str, str]
+    ):
         """Test inserting data from one catalog into another."""
-        catalog_a = "insert_cat_a"
-        catalog_b = "insert_cat_b"
-
-        try:
-            # Create catalogs using ATTACH and schemas
-            self._attach_memory_catalog(gizmosql_adapter, catalog_a)
-            self._attach_memory_catalog(gizmosql_adapter, catalog_b)
-            gizmosql_adapter.execute(f"CREATE SCHEMA {catalog_a}.schema_a")
-            gizmosql_adapter.execute(f"CREATE SCHEMA {catalog_b}.schema_b")
-
-            # Create source table in catalog_a
-            gizmosql_adapter.execute(f"""
-                CREATE TABLE {catalog_a}.schema_a.source_data (
-                    id INT,
-                    value VARCHAR
-                )
-            """)
-            gizmosql_adapter.execute(f"""
-                INSERT INTO {catalog_a}.schema_a.source_data VALUES (1, 'x'), (2, 'y')
-            """)
-
-            # Create target table in catalog_b
-            gizmosql_adapter.execute(f"""
-                CREATE TABLE {catalog_b}.schema_b.target_data (
-                    id INT,
-                    value VARCHAR
-                )
-            """)
-
-            # Insert from catalog_a into catalog_b
-            gizmosql_adapter.execute(f"""
-                INSERT INTO {catalog_b}.schema_b.target_data
-                SELECT * FROM {catalog_a}.schema_a.source_data
-            """)
-
-            # Verify
-            result = gizmosql_adapter.fetchall(
-                f"SELECT * FROM {catalog_b}.schema_b.target_data ORDER BY id"
+        catalog_a, catalog_b = cross_catalogs
+        schema_a = f"{catalog_a}.schema_a_insert"
+        schema_b = f"{catalog_b}.schema_b_insert"
+
+        gizmosql_adapter.execute(f"CREATE SCHEMA {schema_a}")
+        gizmosql_adapter.execute(f"CREATE SCHEMA {schema_b}")
+
+        # Create source table in catalog_a
+        gizmosql_adapter.execute(f"""
+            CREATE TABLE {schema_a}.source_data (
+                id INT,
+                value VARCHAR
             )
-            assert len(result) == 2
-            assert result[0][1] == "x"
-            assert result[1][1] == "y"
-
-        finally:
-            self._ensure_catalog_detached(gizmosql_adapter, catalog_a)
-            self._ensure_catalog_detached(gizmosql_adapter, catalog_b)
+        """)
+        gizmosql_adapter.execute(f"""
+            INSERT INTO {schema_a}.source_data VALUES (1, 'x'), (2, 'y')
+        """)
+
+        # Create target table in catalog_b
+        gizmosql_adapter.execute(f"""
+            CREATE TABLE {schema_b}.target_data (
+                id INT,
+                value VARCHAR
+            )
+        """)
+
+        # Insert from catalog_a into catalog_b
+        gizmosql_adapter.execute(f"""
+            INSERT INTO {schema_b}.target_data
+            SELECT * FROM {schema_a}.source_data
+        """)
+
+        # Verify
+        result = gizmosql_adapter.fetchall(f"SELECT * FROM {schema_b}.target_data ORDER BY id")
+        assert len(result) == 2
+        assert result[0][1] == "x"
+        assert result[1][1] == "y"
@@ -5,10 +5,12 @@ The GizmoSQL server is started as a subprocess by the shared
 is required. ``pytest -m integration tests/integration/`` is enough.
 """
 
+from unittest.mock import patch
+
 import pytest
 from sqlglot import exp
 
-from sqlmesh_gizmosql import GizmoSQLEngineAdapter
+from sqlmesh_gizmosql import GizmoSQLConnectionConfig, GizmoSQLEngineAdapter
 
 pytestmark = [pytest.mark.integration]
 
@@ -21,6 +23,28 @@ def test_connection(gizmosql_adapter: GizmoSQLEngineAdapter):
     assert result[0] == 1
 
 
+def test_closed_connection_is_reused(gizmosql_config: GizmoSQLConnectionConfig):
+    """Test a connection released by one adapter serves the next one without a new connect().
+
+    Releasing a connection runs the pool's reset against the real server, so this fails if
+    that reset starts discarding healthy connections.
+    """
+    from adbc_driver_gizmosql import dbapi
+
+    first = gizmosql_config.create_engine_adapter()
+    assert first.fetchone("SELECT 1")[0] == 1
+    first.close()
+
+    with patch.object(dbapi, "connect", wraps=dbapi.connect) as mock_connect:
+        second = gizmosql_config.create_engine_adapter()
+        try:
+            assert second.fetchone("SELECT 1")[0] == 1
+        finally:
+            second.close()
+
+    mock_connect.assert_not_called()
+
+
 def test_dialect(gizmosql_adapter: GizmoSQLEngineAdapter):
     """Test that the adapter uses the DuckDB dialect."""
     assert gizmosql_adapter.dialect == "duckdb"
@@ -4,11 +4,15 @@ These tests don't require a running GizmoSQL server - they test
 configuration validation and adapter properties.
 """
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlglot import exp
 from sqlmesh.utils.errors import ConfigError
 
+from sqlmesh_gizmosql import connection
 from sqlmesh_gizmosql.adapter import GizmoSQLEngineAdapter
 from sqlmesh_gizmosql.connection import GizmoSQLConnectionConfig
 
@@ -16,6 +20,15 @@ from sqlmesh_gizmosql.connection import GizmoSQLConnectionConfig
 class TestGizmoSQLConnectionConfig:
     """Tests for GizmoSQLConnectionConfig."""
 
+    @pytest.fixture(autouse=True)
+    def reset_connection_pools(self):
+        """Ensure each test starts without pooled connections or verified servers."""
+        connection._POOLS.clear()
+        connection._VERIFIED_VENDORS.clear()
+        yield
+        connection._POOLS.clear()
+        connection._VERIFIED_VENDORS.clear()
+
     def test_default_values(self):
         """Test default configuration values."""
         config = GizmoSQLConnectionConfig(
@@ -28,6 +41,7 @@ class TestGizmoSQLConnectionConfig:
         assert config.use_encryption is True
         assert config.disable_certificate_verification is False
         assert config.auth_type is None
+        assert config.skip_vendor_check is False
         assert config.database is None
         assert config.concurrent_tasks == 4
 
@@ -96,6 +110,25 @@ class TestGizmoSQLConnectionConfig:
         )
         assert config.get_catalog() is None
 
+    def test_missing_driver_raises_config_error(self):
+        """Test config validation fails when adbc_driver_gizmosql can't be found."""
+        with (
+            patch.object(connection, "_adbc_driver_present", None),
+            patch.dict("sys.modules", {"adbc_driver_gizmosql": None}),
+            patch("importlib.util.find_spec", return_value=None),
+        ):
+            with pytest.raises(ConfigError, match="adbc_driver_gizmosql"):
+                GizmoSQLConnectionConfig(username="user", password="pass")
+
+    def test_driver_already_in_sys_modules_passes_validation(self):
+        """Test a driver module loaded without a __spec__ (e.g. a mock) counts as present."""
+        with (
+            patch.object(connection, "_adbc_driver_present", None),
+            patch.dict("sys.modules", {"adbc_driver_gizmosql": MagicMock(__spec__=None)}),
+        ):
+            config = GizmoSQLConnectionConfig(username="user", password="pass")
+        assert config.username == "user"
+
     def test_connection_factory_builds_correct_uri_with_tls(self):
         """Test connection factory builds correct URI with TLS."""
         mock_connect = MagicMock()
@@ -251,6 +284,230 @@ class TestGizmoSQLConnectionConfig:
         # Verify connection was closed after rejection
         mock_conn.close.assert_called_once()
 
+    def test_connection_factory_verifies_backend_once_per_server(self):
+        """Test the vendor check is skipped on later connections to a verified server."""
+        mock_connect = MagicMock()
+        mock_conn = MagicMock()
+        mock_conn.adbc_get_info.return_value = {"vendor_version": "duckdb v1.0.0"}
+        mock_connect.return_value = mock_conn
+
+        config = GizmoSQLConnectionConfig(
+            host="example.com",
+            port=31337,
+            username="user",
+            password="pass",
+        )
+        other_user_config = GizmoSQLConnectionConfig(
+            host="example.com",
+            port=31337,
+            username="other_user",
+            password="pass",
+        )
+
+        mock_dbapi = MagicMock()
+        mock_dbapi.connect = mock_connect
+        mock_module = MagicMock()
+        mock_module.dbapi = mock_dbapi
+
+        with patch.dict(
+            "sys.modules",
+            {"adbc_driver_gizmosql": mock_module, "adbc_driver_gizmosql.dbapi": mock_dbapi},
+        ):
+            config._connection_factory()
+            config._connection_factory()
+            other_user_config._connection_factory()
+
+        assert mock_connect.call_count == 3
+        mock_conn.adbc_get_info.assert_called_once()
+
+    def test_connection_factory_skip_vendor_check(self):
+        """Test skip_vendor_check bypasses the adbc_get_info() round-trip."""
+        mock_connect = MagicMock()
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+
+        config = GizmoSQLConnectionConfig(
+            host="example.com",
+            port=31337,
+            username="user",
+            password="pass",
+            skip_vendor_check=True,
+        )
+
+        mock_dbapi = MagicMock()
+        mock_dbapi.connect = mock_connect
+        mock_module = MagicMock()
+        mock_module.dbapi = mock_dbapi
+
+        with patch.dict(
+            "sys.modules",
+            {"adbc_driver_gizmosql": mock_module, "adbc_driver_gizmosql.dbapi": mock_dbapi},
+        ):
+            config._connection_factory()
+
+        mock_conn.adbc_get_info.assert_not_called()
+
+    def test_connection_factory_reuses_pooled_connection(self):
+        """Test a closed connection is returned to the pool and handed out again."""
+        mock_connect = MagicMock()
+        mock_conn = MagicMock()
+        mock_conn.adbc_get_info.return_value = {"vendor_version": "duckdb v1.0.0"}
+        mock_conn.cursor.return_value.fetchone.return_value = ("memory",)
+        mock_connect.return_value = mock_conn
+
+        config = GizmoSQLConnectionConfig(
+            host="example.com",
+            port=31337,
+            username="user",
+            password="pass",
+        )
+
+        mock_dbapi = MagicMock()
+        mock_dbapi.connect = mock_connect
+        mock_module = MagicMock()
+        mock_module.dbapi = mock_dbapi
+
+        with patch.dict(
+            "sys.modules",
+            {"adbc_driver_gizmosql": mock_module, "adbc_driver_gizmosql.dbapi": mock_dbapi},
+        ):
+            factory = config._connection_factory
+            first = factory()
+            first.close()
+            second = factory()
+
+        assert mock_connect.call_count == 1
+        mock_conn.close.assert_not_called()
+        assert second.cursor() is mock_conn.cursor()
+
+    def test_connection_factory_keys_pool_by_pool_options(self):
+        """Test configs that differ only in pool options don't share a pool."""
+        mock_connect = MagicMock()
+        mock_conn = MagicMock()
+        mock_conn.adbc_get_info.return_value = {"vendor_version": "sqlite v3.0.0"}
+        mock_connect.return_value = mock_conn
+
+        checked = GizmoSQLConnectionConfig(username="user", password="pass")
+        unchecked = GizmoSQLConnectionConfig(
+            username="user",
+            password="pass",
+            skip_vendor_check=True,
+            concurrent_tasks=8,
+            pre_ping=True,
+        )
+
+        mock_dbapi = MagicMock()
+        mock_dbapi.connect = mock_connect
+        mock_module = MagicMock()
+        mock_module.dbapi = mock_dbapi
+
+        with patch.dict(
+            "sys.modules",
+            {"adbc_driver_gizmosql": mock_module, "adbc_driver_gizmosql.dbapi": mock_dbapi},
+        ):
+            with pytest.raises(ConfigError, match="Unsupported GizmoSQL server backend"):
+                checked._connection_factory()
+            unchecked._connection_factory()
+
+        pool = connection._POOLS[unchecked._pool_key]
+        assert pool is not connection._POOLS[checked._pool_key]
+        assert pool._size == 8
+        assert pool._pre_ping is True
+
+    def _release_pooled_connection(self, mock_cursor):
+        """Open a pooled connection over ``mock_cursor``, USE another catalog and close it."""
+        mock_connect = MagicMock()
+        mock_conn = MagicMock()
+        mock_conn.adbc_get_info.return_value = {"vendor_version": "duckdb v1.0.0"}
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        config = GizmoSQLConnectionConfig(username="user", password="pass")
+
+        mock_dbapi = MagicMock()
+        mock_dbapi.connect = mock_connect
+        mock_module = MagicMock()
+        mock_module.dbapi = mock_dbapi
+
+        with patch.dict(
+            "sys.modules",
+            {"adbc_driver_gizmosql": mock_module, "adbc_driver_gizmosql.dbapi": mock_dbapi},
+        ):
+            factory = config._connection_factory
+            conn = factory()
+            conn.cursor().execute("USE other_catalog")
+            conn.close()
+            factory()
+
+        return mock_connect, mock_conn
+
+    def test_release_resets_pooled_connection(self):
+        """Test a released connection is rolled back and put back in its first catalog.
+
+        Whatever error ROLLBACK raises without an open transaction, the connection is kept.
+        """
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = ("memory",)
+
+        def execute(sql):
+            if sql == "ROLLBACK":
+                raise Exception("rollback failed: no open transaction")
+
+        mock_cursor.execute.side_effect = execute
+
+        mock_connect, mock_conn = self._release_pooled_connection(mock_cursor)
+
+        executed = [c.args[0] for c in mock_cursor.execute.call_args_list]
+        assert executed[-2:] == ["ROLLBACK", "USE memory"]
+        assert mock_connect.call_count == 1
+        mock_conn.close.assert_not_called()
+
+    def test_release_discards_connection_that_fails_to_reset(self):
+        """Test a connection whose reset fails is closed instead of being pooled."""
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = ("memory",)
+
+        def execute(sql):
+            if sql in ("ROLLBACK", "USE memory"):
+                raise Exception("connection reset by peer")
+
+        mock_cursor.execute.side_effect = execute
+
+        mock_connect, mock_conn = self._release_pooled_connection(mock_cursor)
+
+        mock_conn.close.assert_called_once()
+        assert mock_connect.call_count == 2
+
+    def test_dispose_pools_closes_pooled_connections(self):
+        """Test the exit-time pool disposal closes the idle connections kept by the pool."""
+        mock_connect = MagicMock()
+        mock_conn = MagicMock()
+        mock_conn.adbc_get_info.return_value = {"vendor_version": "duckdb v1.0.0"}
+        mock_connect.return_value = mock_conn
+
+        config = GizmoSQLConnectionConfig(
+            host="example.com",
+            port=31337,
+            username="user",
+            password="pass",
+        )
+
+        mock_dbapi = MagicMock()
+        mock_dbapi.connect = mock_connect
+        mock_module = MagicMock()
+        mock_module.dbapi = mock_dbapi
+
+        with patch.dict(
+            "sys.modules",
+            {"adbc_driver_gizmosql": mock_module, "adbc_driver_gizmosql.dbapi": mock_dbapi},
+        ):
+            factory = config._connection_factory
+            factory().close()
+
+        connection._dispose_pools()
+
+        mock_conn.close.assert_called_once()
+
 
 class TestGizmoSQLEngineAdapter:
     """Tests for GizmoSQLEngineAdapter properties."""
@@ -273,6 +530,51 @@ class TestGizmoSQLEngineAdapter:
         assert "TABLE" in GizmoSQLEngineAdapter.SUPPORTED_DROP_CASCADE_OBJECT_KINDS
         assert "VIEW" in GizmoSQLEngineAdapter.SUPPORTED_DROP_CASCADE_OBJECT_KINDS
 
+    def test_df_to_source_queries_ingests_target_columns_only(self):
+        """Test bulk ingestion sends the target columns in order and no pandas index."""
+        import pandas as pd
+
+        mock_conn = MagicMock()
+        adapter = GizmoSQLEngineAdapter(lambda: mock_conn)
+
+        df = pd.DataFrame(
+            {"name": ["alice", "bob"], "extra": [0.5, 1.5], "id": [1, 2]},
+            index=[10, 20],
+        )
+        columns_to_types = {
+            "id": exp.DataType.build("INT"),
+            "name": exp.DataType.build("VARCHAR"),
+        }
+        adapter._df_to_source_queries(
+            df, columns_to_types, batch_size=0, target_table="db.target_table"
+        )
+
+        mock_ingest = mock_conn.cursor.return_value.adbc_ingest
+        mock_ingest.assert_called_once()
+        arrow_table = mock_ingest.call_args.kwargs["data"]
+        assert arrow_table.column_names == ["id", "name"]
+        assert "__index_level_0__" not in arrow_table.column_names
+        assert arrow_table.to_pydict() == {"id": [1, 2], "name": ["alice", "bob"]}
+        assert mock_ingest.call_args.kwargs["temporary"] is True
+
+    def test_df_to_source_queries_missing_column_raises(self):
+        """Test a DataFrame lacking a target column fails before anything is ingested."""
+        import pandas as pd
+
+        mock_conn = MagicMock()
+        adapter = GizmoSQLEngineAdapter(lambda: mock_conn)
+
+        df = pd.DataFrame({"id": [1, 2]})
+        columns_to_types = {
+            "id": exp.DataType.build("INT"),
+            "name": exp.DataType.build("VARCHAR"),
+        }
+        with pytest.raises(KeyError, match="name"):
+            adapter._df_to_source_queries(
+                df, columns_to_types, batch_size=0, target_table="db.target_table"
+            )
+        mock_conn.cursor.return_value.adbc_ingest.assert_not_called()
+
 
 class TestRegistration:
     """Tests for automatic registration with SQLMesh."""
@@ -303,3 +605,55 @@ class TestRegistration:
 
         assert "gizmosql" in conn_module.DIALECT_TO_TYPE
         assert conn_module.DIALECT_TO_TYPE["gizmosql"] == "duckdb"
+
+    def test_import_defers_registration_until_sqlmesh_loads(self):
+        """Test importing the package alone doesn't import SQLMesh, yet still registers."""
+        code = (
+            "import sys\n"
+            "import sqlmesh_gizmosql\n"
+            "assert 'sqlmesh' not in sys.modules, 'sqlmesh imported eagerly'\n"
+            "from sqlmesh.core.config import connection\n"
+            "assert 'gizmosql' in connection.CONNECTION_CONFIG_TO_TYPE\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=False
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_import_before_sqlmesh_parses_gizmosql_config(self):
+        """Test the documented pattern: import the package, then SQLMesh, then parse a config."""
+        code = (
+            "import sqlmesh_gizmosql\n"
+            "import sqlmesh\n"
+            "from sqlmesh.core.config import Config\n"
+            "config = Config.parse_obj({'gateways': {'local': {'connection': {\n"
+            "    'type': 'gizmosql', 'username': 'user', 'password': 'pass'}}},\n"
+            "    'model_defaults': {'dialect': 'duckdb'}})\n"
+            "assert config.gateways['local'].connection.type_ == 'gizmosql'\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=False
+        )
+        assert result.returncode == 0, result.stderr
+
+    @pytest.mark.parametrize(
+        "import_statement",
+        [
+            "from sqlmesh_gizmosql.adapter import GizmoSQLEngineAdapter",
+            "from sqlmesh_gizmosql.connection import GizmoSQLConnectionConfig",
+        ],
+    )
+    def test_submodule_import_registers(self, import_statement):
+        """Test importing either submodule first registers GizmoSQL with SQLMesh."""
+        code = (
+            f"{import_statement}\n"
+            "from sqlmesh.core import engine_adapter\n"
+            "from sqlmesh.core.config import connection\n"
+            "assert 'gizmosql' in engine_adapter.DIALECT_TO_ENGINE_ADAPTER\n"
+            "assert 'gizmosql' in connection.CONNECTION_CONFIG_TO_TYPE\n"
+            "assert 'gizmosql' in connection.DIALECT_TO_TYPE\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=False
+        )
+        assert result.returncode == 0, result.stderr